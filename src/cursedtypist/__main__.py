@@ -4,6 +4,11 @@ Main entry point.
 """
 
 import argparse
+import contextlib
+import hashlib
+import os
+import re
+import stat
 import sys
 from pathlib import Path
 from typing import Optional
@@ -11,6 +16,12 @@ from typing import Optional
 from .params import DEFAULT_TEXT
 from .frontend import Frontend
 
+# any run of whitespace including line breaks
+_WHITESPACE = re.compile(r"\s+")
+
+# bump when the text preparation changes to invalidate the cached texts
+_CACHE_VERSION = 1
+
 
 def get_game_text(path: Optional[Path]) -> str:
     """Get the game text by given path."""
@@ -18,18 +29,74 @@ def get_game_text(path: Optional[Path]) -> str:
         # if no text provided, use default text
         return DEFAULT_TEXT
 
-    # try to read the text under the path given
+    # try to read the text under the path given in one go
     try:
-        return path.read_text(errors="strict")
+        with path.open("rb") as file:
+            # just a hint, pipes do not support it
+            if hasattr(os, "posix_fadvise"):
+                with contextlib.suppress(OSError):
+                    os.posix_fadvise(file.fileno(), 0, 0,
+                                     os.POSIX_FADV_SEQUENTIAL)
+            data = file.read()
     except OSError as err:
         print(f"cannot open file: {err}")
         sys.exit(1)
 
+    try:
+        return data.decode("utf-8", errors="strict")
+    except UnicodeDecodeError as err:
+        print(f"cannot decode file: {err}")
+        sys.exit(1)
+
+
+def get_cache_path(path: Path) -> Optional[Path]:
+    """Get the cache file for the prepared text of the file given.
+
+    The cache key depends on the file location, modification time and size,
+    so the changed file gets a fresh cache entry. Only regular files are
+    cached, pipes and devices give a different text every time.
+    """
+    try:
+        info = path.stat()
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    except (OSError, RuntimeError):
+        return None
+
+    if not stat.S_ISREG(info.st_mode):
+        return None
+
+    ident = (f"{_CACHE_VERSION}:{path.resolve()}:"
+             f"{info.st_mtime_ns}:{info.st_size}")
+    key = hashlib.blake2b(ident.encode(), digest_size=16).hexdigest()
+    return Path(cache_home) / "cursedtypist" / f"{key}.txt"
+
+
+def save_cached_text(cache: Path, text: str) -> None:
+    """Save the prepared text into cache, failures are not fatal."""
+    tmp = cache.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(text.encode("utf-8"))
+        os.replace(tmp, cache)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+
 
 def prepare_game_text(path: Optional[Path]) -> str:
     """Prepare text for the game."""
-    text = get_game_text(path)
-    return " ".join(line.strip() for line in text.splitlines())
+    cache = get_cache_path(path) if path is not None else None
+    if cache is not None:
+        try:
+            return cache.read_bytes().decode("utf-8")
+        except (OSError, UnicodeDecodeError):
+            pass  # no cache yet, prepare the text from scratch
+
+    text = _WHITESPACE.sub(" ", get_game_text(path)).strip()
+    if cache is not None:
+        save_cached_text(cache, text)
+
+    return text
 
 
 def prepare_frontend(frontend: str) -> Frontend:
@@ -2,10 +2,13 @@
 
 import asyncio
 import curses
+import itertools
+import os
 import random
 import sys
 from dataclasses import dataclass
-from typing import Any, Optional, Tuple, TYPE_CHECKING
+from typing import (Any, Dict, Iterator, List, NamedTuple, Optional, Tuple,
+                    TYPE_CHECKING)
 
 from . import Frontend
 
@@ -42,150 +45,318 @@ class Params:
 
     # reserve some characters to print floor lag value
     FLOOR_LAG_WIDTH = 6  # minus sign + 4 digits + space
+    FLOOR_LAG_FORMAT = "{:" + str(FLOOR_LAG_WIDTH) + "}"
+    FLOOR_LAG_FILL = FLOOR_PIC * FLOOR_LAG_WIDTH
     DRAW_OFFSET = max(FLOOR_LAG_WIDTH, PLAYER_INIT_OFFSET) - PLAYER_INIT_OFFSET
 
     LAVA_LINE = 6
     LAVA_CHARS = "~#@_+-:?*"
+    LAVA_POOL_SIZE = 65536
+    LAVA_CHURN = 4  # lava cells changed per frame
 
     MESSAGE_LINE = 8
     MESSAGE_COLUMN = 12
 
 
+# maps every possible random byte to some lava character
+_LAVA_TABLE = bytes(ord(Params.LAVA_CHARS[i % len(Params.LAVA_CHARS)])
+                    for i in range(256))
+
+
 class CursesController(GameController):
     """Curses-based implementation for a cursedtypist game controller."""
 
+    __slots__ = ("view", "screen")
+
+    view: "CursesView"
     screen: _CursesWindow
 
-    def __init__(self, model: GameModel, screen: _CursesWindow):
+    def __init__(self, model: GameModel, view: "CursesView"):
         """Initialize curses game controller."""
         super().__init__(model)
-        self.screen = screen
+        self.view = view
+        self.screen = view.screen
+
+    def start_input(self) -> None:
+        """Watch stdin for the keystrokes.
 
-    async def wait_key(self) -> str:
-        """Wait for the data in stdin and get key using `curses`."""
-        # first downgrade the stdin stream to corresponding file descriptior
-        stdinfd = sys.stdin.fileno()
+        The reader is registered once for the whole game, `getkey` is switched
+        to non-blocking mode to drain all the pending keys on every wakeup.
+        """
+        self.screen.nodelay(True)
+        loop = asyncio.get_running_loop()
+        loop.add_reader(sys.stdin.fileno(), self.read_keys)
+
+    def stop_input(self) -> None:
+        """Stop watching stdin."""
+        loop = asyncio.get_running_loop()
+        loop.remove_reader(sys.stdin.fileno())
+        self.screen.nodelay(False)
+
+    def read_keys(self) -> None:
+        """Get all the available keys using `curses` when stdin is ready.
+
+        The keys read at once are delivered as a single batch, so the screen
+        is refreshed once per burst of input.
+        """
+        keys = []
+        while True:
+            try:
+                key = self.screen.getkey()
+            except curses.error:
+                # no more input for now
+                break
+
+            # curses reports the terminal size change as a special key
+            if key == "KEY_RESIZE":
+                self.view.resize()
+            else:
+                keys.append(key)
+
+        if keys:
+            self.keys_pressed(tuple(keys))
+
+
+class _Attrs(NamedTuple):
+    """Curses attributes precomputed for drawing."""
+
+    lava: int
+    floor: int
+    floor_active: int
+    text: int
+    player: int
+    floor_chr: int  # floor picture combined with its attributes
 
-        # then register the dumb reader for this fd which does nothing
-        future: asyncio.Future[None] = asyncio.Future()
-        loop = asyncio.get_event_loop()
-        loop.add_reader(stdinfd, future.set_result, None)
 
-        # and then put this dumb reader into oneshot mode
-        future.add_done_callback(lambda f: loop.remove_reader(stdinfd))
+class _Lava:
+    """The lava line taking random characters from the precomputed pool."""
+
+    __slots__ = ("pool", "offset", "rng", "cells")
+
+    pool: bytes
+    offset: int
+    rng: random.Random
+    cells: bytearray
+
+    def __init__(self) -> None:
+        self.pool = os.urandom(Params.LAVA_POOL_SIZE).translate(_LAVA_TABLE)
+        self.offset = 0
+        self.rng = random.Random()
+        self.cells = bytearray()
+
+    def take(self, width: int) -> bytes:
+        """Take the next random lava characters from the pool."""
+        if self.offset + width > len(self.pool):
+            self.offset = 0
+
+        start, self.offset = self.offset, self.offset + width
+        return self.pool[start:self.offset]
+
+    def draw(self, screen: _CursesWindow, xmax: int, attr: int) -> None:
+        """Make the lava bubble by changing a few random cells.
+
+        The whole line is painted only the first time or when the width has
+        changed, otherwise only `LAVA_CHURN` cells are redrawn.
+        """
+        if len(self.cells) != xmax:
+            self.cells = bytearray(self.take(xmax))
+            screen.addstr(Params.LAVA_LINE, 1, self.cells.decode("ascii"),
+                          attr)
+            return
+
+        for char in self.take(Params.LAVA_CHURN):
+            pos = self.rng.randrange(xmax)
+            self.cells[pos] = char
+            screen.addch(Params.LAVA_LINE, 1 + pos, char, attr)
+
+
+class _Frame:
+    """Changes staged for the next frame and memos of what is already drawn."""
+
+    __slots__ = ("damage", "title", "message", "floor")
+
+    damage: List[Tuple[int, int, str, int]]
+    title: Tuple[str, str]
+    message: str
+    floor: Optional[Tuple[int, int]]
+
+    def __init__(self) -> None:
+        self.damage = []
+        self.forget()
+
+    def forget(self) -> None:
+        """Forget what is drawn, e.g. after the window is erased."""
+        self.title = ("", "")
+        self.message = ""
+        self.floor = None
+
+    def take_runs(self) -> List[Tuple[int, int, str, int]]:
+        """Take the staged changes merged into as few runs as possible.
+
+        Changes are split into cells (the latest change of the cell wins) and
+        then neighbour cells with the same attributes are merged into runs.
+        """
+        cells: Dict[Tuple[int, int], Tuple[str, int]] = {}
+        for line, col, text, attr in self.damage:
+            for i, char in enumerate(text):
+                cells[line, col + i] = (char, attr)
+        self.damage.clear()
 
-        # await for stdin events
-        await future
+        runs: List[Tuple[int, int, List[str], int]] = []
+        for (line, col), (char, attr) in sorted(cells.items()):
+            if runs:
+                rline, rcol, rchars, rattr = runs[-1]
+                if (rline, rcol + len(rchars), rattr) == (line, col, attr):
+                    rchars.append(char)
+                    continue
+            runs.append((line, col, [char], attr))
 
-        # now there is some data in stdin, `getkey` will not block
-        return self.screen.getkey()
+        return [(line, col, "".join(chars), attr)
+                for line, col, chars, attr in runs]
 
 
 class CursesView(GameView):
     """Curses graphic implementation for the typing game."""
 
+    __slots__ = ("screen", "player", "floor", "text", "_attrs", "_limits",
+                 "_lava", "_frame")
+
     screen: _CursesWindow
     player: int
     floor: int
-    text: Optional[str]
+    text: Iterator[str]
+    _attrs: _Attrs
+    _limits: Tuple[int, int]
+    _lava: _Lava
+    _frame: _Frame
 
     def __init__(self, screen: _CursesWindow):
         """Prepare the curses window."""
         curses.curs_set(False)
-        self._setup_colors()
+        # do not check for typeahead in the middle of `doupdate`, the input is
+        # handled by the event loop and every frame is written in one go
+        curses.typeahead(-1)
+        self._attrs = self._setup_colors()
         self.screen = screen
         self.player = PLAYER_INIT_OFFSET + Params.DRAW_OFFSET
         self.floor = 1 + Params.DRAW_OFFSET
-        self.text = None
+        self.text = iter("")
+        self._lava = _Lava()
+        self._frame = _Frame()
+        self.resize()
 
     @staticmethod
-    def _setup_colors() -> None:
+    def _setup_colors() -> _Attrs:
         curses.start_color()
         curses.init_pair(1, curses.COLOR_RED, curses.COLOR_BLACK)
         curses.init_pair(2, curses.COLOR_YELLOW, curses.COLOR_BLACK)
         curses.init_pair(3, curses.COLOR_BLUE, curses.COLOR_BLACK)
         curses.init_pair(4, curses.COLOR_GREEN, curses.COLOR_BLACK)
 
+        # precompute the attributes used in drawing
+        bold, reverse = curses.A_BOLD, curses.A_REVERSE
+        floor = curses.color_pair(2) | bold
+        return _Attrs(lava=curses.color_pair(1) | bold | reverse,
+                      floor=floor,
+                      floor_active=floor | reverse,
+                      text=curses.color_pair(3) | bold,
+                      player=curses.color_pair(4) | bold,
+                      floor_chr=ord(Params.FLOOR_PIC) | floor)
+
+    def _damage_cells(self, line: int, col: int, cells: str,
+                      attr: int = 0) -> None:
+        """Remember the small change to draw it later in `refresh`."""
+        self._frame.damage.append((line, col, cells, attr))
+
+    def _flush_damage(self) -> None:
+        """Draw all the remembered changes with as few addstr as possible."""
+        if not self._frame.damage:
+            return
+
+        for line, col, text, attr in self._frame.take_runs():
+            self.screen.addstr(line, col, text, attr)
+
     def _get_limits(self) -> Tuple[int, int]:
-        ymax, xmax = self.screen.getmaxyx()
-        return ymax - 2, xmax - 2  # compensate borders
+        return self._limits
 
-    def _clear_title_prompt_lines(self) -> None:
-        _, xmax = self._get_limits()
-        self.screen.addstr(Params.TITLE_LINE, 1, " " * xmax)
-        self.screen.addstr(Params.PROMPT_LINE, 1, " " * xmax)
+    def resize(self) -> None:
+        """Update the cached window size.
 
-    def _clear_player_line(self) -> None:
-        _, xmax = self._get_limits()
-        self.screen.addstr(Params.PLAYER_LINE, 1, " " * xmax)
-
-    @staticmethod
-    def _lava_attr() -> int:
-        return curses.color_pair(1) | curses.A_BOLD | curses.A_REVERSE
+        Must be called when the terminal size changes (`KEY_RESIZE`).
+        """
+        ymax, xmax = self.screen.getmaxyx()
+        self._limits = (ymax - 2, xmax - 2)  # compensate borders
 
-    @staticmethod
-    def _floor_attr() -> int:
-        return curses.color_pair(2) | curses.A_BOLD
+    def _clear_line(self, line: int, col: int, width: int) -> None:
+        """Blank the part of the line without touching the border."""
+        self.screen.hline(line, col, " ", width)
 
-    @staticmethod
-    def _floor_active_attr() -> int:
-        return curses.color_pair(2) | curses.A_BOLD | curses.A_REVERSE
+    def _set_title(self, xmax: int, title: str, prompt: str) -> None:
+        """Replace the title and prompt lines unless they are already set."""
+        if (title, prompt) == self._frame.title:
+            return
 
-    @staticmethod
-    def _text_attr() -> int:
-        return curses.color_pair(3) | curses.A_BOLD
+        self._frame.title = (title, prompt)
+        self._clear_line(Params.TITLE_LINE, 1, xmax)
+        self._clear_line(Params.PROMPT_LINE, 1, xmax)
+        self.screen.addstr(Params.TITLE_LINE, 1, title)
+        self.screen.addstr(Params.PROMPT_LINE, 1, prompt)
 
-    @staticmethod
-    def _player_attr() -> int:
-        return curses.color_pair(4) | curses.A_BOLD
+    def _clear_player_line(self, xmax: int) -> None:
+        self._clear_line(Params.PLAYER_LINE, 1, xmax)
 
     def _draw_floor_lag(self) -> None:
-        fmt = "{:" + str(Params.FLOOR_LAG_WIDTH) + "}"
-        self.screen.addstr(Params.FLOOR_LINE, 1, fmt.format(self.floor),
-                           self._floor_active_attr())
+        self._damage_cells(Params.FLOOR_LINE, 1,
+                           Params.FLOOR_LAG_FORMAT.format(self.floor),
+                           self._attrs.floor_active)
 
-    def _update_game_screen(self) -> None:
+    def _update_game_screen(self, xmax: int) -> None:
         """Update the game screen.
 
         As curses window is limited, just draw the part of the game text. The
         lava is random punctuation, and the player char is just a dollar sign.
         """
+        self._flush_damage()
+
         old_offset = self.player - self.floor
         self.player = PLAYER_INIT_OFFSET + Params.DRAW_OFFSET
         self.floor = self.player - old_offset
 
-        _, xmax = self._get_limits()
-        to_display = xmax - self.player
-        display, self.text = self.text[:to_display], self.text[to_display:]
+        # only the part displayed on this page is taken from the text
+        display = "".join(itertools.islice(self.text, xmax - self.player))
 
-        self._clear_player_line()
+        self._clear_player_line(xmax)
 
         self.screen.addstr(Params.PLAYER_LINE, self.player,
-                           Params.PLAYER_PIC, self._player_attr())
-        self.screen.addstr(Params.FLOOR_LINE, max(1, self.floor),
-                           Params.FLOOR_PIC * (xmax - max(1, self.floor) + 1),
-                           self._floor_attr())
+                           Params.PLAYER_PIC, self._attrs.player)
+
+        # the floor stays intact while the player is far ahead of the lava
+        floor = (max(1, self.floor), xmax)
+        if floor != self._frame.floor:
+            self.screen.hline(Params.FLOOR_LINE, floor[0],
+                              self._attrs.floor_chr, xmax - floor[0] + 1)
+            self._frame.floor = floor
+
         self.screen.addstr(Params.PLAYER_LINE, self.player + 1,
-                           display, self._text_attr())
-        self.screen.addstr(Params.LAVA_LINE, 1,
-                           "".join(random.choices(Params.LAVA_CHARS, k=xmax)),
-                           self._lava_attr())
+                           display, self._attrs.text)
+        self._lava.draw(self.screen, xmax, self._attrs.lava)
 
         if self.floor < 1:
             self._draw_floor_lag()
-
-        self.screen.refresh()
+            self._flush_damage()
 
     def init_screen(self) -> None:
         """Draw the initial screen.
 
-        Draw the border and print the prompt.
+        Draw the border and print the prompt. The terminal is already cleared
+        by `initscr`, so `erase` is enough and no forced repaint is needed.
         """
-        self.screen.clear()
+        self.screen.erase()
+        # the lines erased have to be drawn again
+        self._frame.forget()
         self.screen.border(0)
-        self.screen.addstr(Params.TITLE_LINE, 1, Params.INIT_TITLE)
-        self.screen.addstr(Params.PROMPT_LINE, 1, Params.INIT_PROMPT)
-        self.screen.refresh()
+        _, xmax = self._get_limits()
+        self._set_title(xmax, Params.INIT_TITLE, Params.INIT_PROMPT)
 
     def game_screen(self, text: str) -> None:
         """Draw the main game screen.
@@ -193,36 +364,34 @@ class CursesView(GameView):
         As curses window is limited, just draw the part of the game text. The
         lava is random punctuation, and the player char is just a dollar sign.
         """
+        _, xmax = self._get_limits()
+
         # print the game mode title and prompt
-        self._clear_title_prompt_lines()
-        self.screen.addstr(Params.TITLE_LINE, 1, Params.GAME_TITLE)
-        self.screen.addstr(Params.PROMPT_LINE, 1, Params.GAME_PROMPT)
+        self._set_title(xmax, Params.GAME_TITLE, Params.GAME_PROMPT)
 
-        self.text = text
-        self._update_game_screen()
+        self.text = iter(text)
+        self._update_game_screen(xmax)
 
     def death_screen(self) -> None:
         """Draw the death screen.
 
         Drop the player character into the lava and set the gameover title.
         """
-        self._clear_title_prompt_lines()
-        self.screen.addstr(Params.TITLE_LINE, 1, Params.GAMEOVER_TITLE)
-        self.screen.addstr(Params.PROMPT_LINE, 1, Params.GAMEOVER_PROMPT)
+        self._flush_damage()
+        _, xmax = self._get_limits()
+        self._set_title(xmax, Params.GAMEOVER_TITLE, Params.GAMEOVER_PROMPT)
         self.screen.addstr(Params.PLAYER_LINE, self.player, " ")
         self.screen.addstr(Params.LAVA_LINE, self.player,
-                           Params.PLAYER_PIC, self._lava_attr())
-        self.screen.refresh()
+                           Params.PLAYER_PIC, self._attrs.lava)
 
     def win_screen(self) -> None:
         """Draw the winning screen.
 
         Just print the winning message.
         """
-        self._clear_title_prompt_lines()
-        self.screen.addstr(Params.TITLE_LINE, 1, Params.WIN_TITLE)
-        self.screen.addstr(Params.PROMPT_LINE, 1, Params.WIN_PROMPT)
-        self.screen.refresh()
+        self._flush_damage()
+        _, xmax = self._get_limits()
+        self._set_title(xmax, Params.WIN_TITLE, Params.WIN_PROMPT)
 
     def print_message(self, msg: str) -> None:
         """Print a new message.
@@ -230,16 +399,20 @@ class CursesView(GameView):
         Print some new message to the special message region. When empty string
         provided, then the message region is cleared.
         """
+        # the same message is repeated on every key while the key is held
+        if msg == self._frame.message:
+            return
+
+        self._frame.message = msg
         if not msg:
             _, xmax = self._get_limits()
             to_fill = xmax - Params.MESSAGE_COLUMN
-            self.screen.addstr(Params.MESSAGE_LINE,
-                               Params.MESSAGE_COLUMN,
-                               " " * to_fill)
+            self._clear_line(Params.MESSAGE_LINE, Params.MESSAGE_COLUMN,
+                             to_fill)
         else:
             self.screen.addstr(Params.MESSAGE_LINE,
                                Params.MESSAGE_COLUMN,
-                               msg, self._lava_attr())
+                               msg, self._attrs.lava)
 
     def drop_floor(self) -> None:
         """Drop one floor cell."""
@@ -247,30 +420,37 @@ class CursesView(GameView):
             self._draw_floor_lag()
         elif self.floor == 0:
             # refill the initial part of the floor
-            self.screen.addstr(Params.FLOOR_LINE, 1,
-                               Params.FLOOR_PIC * Params.FLOOR_LAG_WIDTH,
-                               self._floor_attr())
+            self._damage_cells(Params.FLOOR_LINE, 1,
+                               Params.FLOOR_LAG_FILL,
+                               self._attrs.floor)
         else:
-            self.screen.addstr(Params.FLOOR_LINE, self.floor, " ")
-            self.screen.addstr(Params.FLOOR_LINE, self.floor + 1,
-                               Params.FLOOR_PIC, self._floor_active_attr())
+            self._frame.floor = None  # the floor drawn is broken now
+            self._damage_cells(Params.FLOOR_LINE, self.floor, " ")
+            self._damage_cells(Params.FLOOR_LINE, self.floor + 1,
+                               Params.FLOOR_PIC, self._attrs.floor_active)
 
         self.floor += 1
 
     def move_player(self) -> None:
         """Move player one step futher."""
-        self.screen.addstr(Params.PLAYER_LINE, self.player, " ")
-        self.screen.addstr(Params.PLAYER_LINE, self.player + 1,
-                           Params.PLAYER_PIC, self._player_attr())
+        self._damage_cells(Params.PLAYER_LINE, self.player, " ")
+        self._damage_cells(Params.PLAYER_LINE, self.player + 1,
+                           Params.PLAYER_PIC, self._attrs.player)
         self.player += 1
 
         _, xlim = self._get_limits()
         if self.player == xlim:
-            self._update_game_screen()
+            self._update_game_screen(xlim)
 
     def refresh(self) -> None:
-        """Refresh the curses screen."""
-        self.screen.refresh()
+        """Flush all the staged changes to the terminal at once.
+
+        Nothing is written to the terminal when nothing has changed, ncurses
+        compares the window with the screen itself.
+        """
+        self._flush_damage()
+        self.screen.noutrefresh()
+        curses.doupdate()
 
 
 @dataclass
@@ -281,26 +461,36 @@ class CursesFrontend(Frontend):
         """Run the game in curses-wrapped environment."""
         view = CursesView(screen)
         model = GameModel(view, text)
-        controller = CursesController(model, screen)
 
-        # wait any key to start the game
-        _ = screen.getkey()
+        # wait any key to start the game, the resize is not a key press
+        while screen.getkey() == "KEY_RESIZE":
+            view.resize()
+            view.init_screen()
+            view.refresh()
 
         # start the game
-        loop = asyncio.get_event_loop()
-        result = loop.run_until_complete(controller.loop())
+        result = asyncio.run(self.play(model, view))
 
         # refresh the screen now to not to lose last update
-        screen.refresh()
+        view.refresh()
 
-        # waiting for quit key
-        while True:
-            key = screen.getkey()
-            if key == "q":
-                break
+        # waiting for quit key, make sure `getkey` blocks instead of spinning
+        screen.nodelay(False)
+        while screen.getkey() != "q":
+            pass
 
         return result
 
+    @staticmethod
+    async def play(model: GameModel, view: CursesView) -> bool:
+        """Create the controller and play the game in asyncio context.
+
+        The controller is created inside the running event loop, so all its
+        asyncio primitives belong to this loop.
+        """
+        controller = CursesController(model, view)
+        return await controller.loop()
+
     def run(self, text: str) -> bool:
         """Prepare the components and make `curses.wrapper` call."""
         return curses.wrapper(self.wrap_run, text)
@@ -2,14 +2,24 @@
 
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from enum import IntEnum
+from typing import Any, Callable, Iterable, Optional, Tuple
 
-from .params import PLAYER_INIT_OFFSET, TIMER_PERIOD_SEC
+from .params import PLAYER_INIT_OFFSET, TIMER_MAX_TICKS, TIMER_PERIOD_SEC
+
+
+class Event(IntEnum):
+    """Kinds of the events queued by the game controller."""
+
+    KEY = 0
+    TIMER = 1
 
 
 class GameView(ABC):
     """Interface between game and underlying drawing system."""
 
+    __slots__ = ()
+
     @abstractmethod
     def init_screen(self) -> None:
         """Draw the initial game scene."""
@@ -49,11 +59,12 @@ class GameModel:
     Contains text to type and player/tracer positions.
     """
 
+    __slots__ = ("view", "tracer", "player", "text", "result")
+
     view: GameView
     tracer: int
     player: int
     text: str
-    border: int
     result: Optional[bool]
 
     def __init__(self, view: GameView, text: str):
@@ -64,13 +75,25 @@ class GameModel:
         self.text = text
         self.result = None
         self.view.init_screen()
+        self.view.refresh()
 
     def start(self) -> None:
         """Push the text to the view and start."""
         self.view.game_screen(self.text)
+        self.view.refresh()
 
     def player_move(self, key: str) -> None:
         """Process player input and try to move player further."""
+        self.player_input((key,))
+
+    def player_input(self, keys: Iterable[str]) -> None:
+        """Process a batch of keystrokes."""
+        for key in keys:
+            self._process_key(key)
+            if self.result is not None:
+                break
+
+    def _process_key(self, key: str) -> None:
         if key == self.text[self.player]:
             self.player += 1
             self.view.print_message("")
@@ -90,18 +113,24 @@ class GameModel:
                 self.view.death_screen()
                 self.result = False
 
-        self.view.refresh()
+    def timer_fired(self, ticks: int = 1) -> None:
+        """Crash the floor behind the player.
 
-    def timer_fired(self) -> None:
-        """Crash the floor behind the player."""
-        self.tracer += 1
-        self.view.drop_floor()
+        Several ticks coalesced by the controller are processed at once, the
+        floor never crashes further than the player position.
+        """
+        drops = min(ticks, self.player - self.tracer)
+        self.tracer += drops
+        for _ in range(drops):
+            self.view.drop_floor()
 
         # check whether the game has ended
         if self.tracer == self.player:
             self.view.death_screen()
             self.result = False
 
+    def refresh(self) -> None:
+        """Show all the changes made by the processed events."""
         self.view.refresh()
 
     def get_result(self) -> Optional[bool]:
@@ -115,15 +144,28 @@ class GameModel:
 
 
 class GameController(ABC):
-    """Interface between low-level events and game logic."""
+    """Interface between low-level events and game logic.
+
+    Keystrokes and timer ticks are delivered by callbacks into a single event
+    queue, the game loop just dispatches the queued events one by one and
+    refreshes the screen once the queue is drained.
+    """
+
+    __slots__ = ("model", "state", "events", "timer", "deadline")
 
     model: GameModel
     state: asyncio.Future[bool]
+    events: asyncio.Queue[Tuple[Event, Any]]
+    timer: Optional[asyncio.TimerHandle]
+    deadline: float
 
     def __init__(self, model: GameModel):
         """Create the game controller."""
         self.model = model
         self.state = asyncio.Future()
+        self.events = asyncio.Queue()
+        self.timer = None
+        self.deadline = 0.0
 
     def check_finish_state(self) -> bool:
         """Check whether the game is finished."""
@@ -135,28 +177,73 @@ class GameController(ABC):
         return False
 
     @abstractmethod
-    async def wait_key(self) -> str:
-        """Process keystrokes."""
-
-    async def stdin_actor(self) -> None:
-        """Perform async reading from stdin with dirty hack."""
-        while True:
-            key = await self.wait_key()
-            self.model.player_move(key)
-            if self.check_finish_state():
-                return
-
-    async def timer_actor(self) -> None:
-        """Generate timer events and notify controller."""
-        while True:
-            await asyncio.sleep(TIMER_PERIOD_SEC)
-            self.model.timer_fired()
-            if self.check_finish_state():
-                return
+    def start_input(self) -> None:
+        """Start delivering keystrokes with `keys_pressed` calls."""
+
+    @abstractmethod
+    def stop_input(self) -> None:
+        """Stop delivering keystrokes."""
+
+    def keys_pressed(self, keys: Tuple[str, ...]) -> None:
+        """Put the batch of keystrokes into the event queue."""
+        self.events.put_nowait((Event.KEY, keys))
+
+    def timer_tick(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Put the timer event into the event queue and rearm the timer.
+
+        The next tick is scheduled at the absolute deadline, so the delays of
+        the event loop do not accumulate into the timer drift. If the loop was
+        late for several periods, the missed ticks go as a single event. The
+        loop may also run the timer a bit early, which is still one tick.
+        The pause of the whole process does not count, the timer is just
+        resynchronized after it.
+        """
+        now = loop.time()
+        ticks = max(1, 1 + int((now - self.deadline) // TIMER_PERIOD_SEC))
+        if ticks > TIMER_MAX_TICKS:
+            ticks = 1
+            self.deadline = now + TIMER_PERIOD_SEC
+        else:
+            self.deadline += ticks * TIMER_PERIOD_SEC
+
+        self.events.put_nowait((Event.TIMER, ticks))
+        self.timer = loop.call_at(self.deadline, self.timer_tick, loop)
+
+    def keyboard_event(self, keys: Tuple[str, ...]) -> None:
+        """Process the batch of keystrokes."""
+        self.model.player_input(keys)
+
+    def timer_event(self, ticks: int) -> None:
+        """Process the timer ticks."""
+        self.model.timer_fired(ticks)
 
     async def loop(self) -> bool:
         """Start the game in asyncio context."""
+        # indexed by the event kind
+        handlers: Tuple[Callable[[Any], None], ...] = (
+            self.keyboard_event,
+            self.timer_event,
+        )
+
         self.model.start()
-        asyncio.create_task(self.stdin_actor())
-        asyncio.create_task(self.timer_actor())
+        self.start_input()
+        loop = asyncio.get_running_loop()
+        self.deadline = loop.time() + TIMER_PERIOD_SEC
+        self.timer = loop.call_at(self.deadline, self.timer_tick, loop)
+
+        try:
+            while True:
+                kind, arg = await self.events.get()
+                handlers[kind](arg)
+                if self.check_finish_state():
+                    break
+
+                # do not redraw while there are more events to process
+                if self.events.empty():
+                    self.model.refresh()
+        finally:
+            self.timer.cancel()
+            self.stop_input()
+
+        self.model.refresh()
         return await self.state
@@ -1,6 +1,10 @@
 """Parameters for game configuration."""
 
+# the only periodic wakeup of the game: without input the event loop sleeps in
+# the selector until the next tick, so longer period means less idle CPU usage
 TIMER_PERIOD_SEC = 0.45
+# the timer late for more ticks means the game was paused (e.g. with Ctrl-Z)
+TIMER_MAX_TICKS = 3
 PLAYER_INIT_OFFSET = 10
 DEFAULT_TEXT = """\
 You can play on your own texts - just pass the path as a command line
@@ -4,36 +4,55 @@ Simply replays the text with huge speed.
 """
 
 import asyncio
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from typing import Optional
 
 from cursedtypist import game
 from cursedtypist import params
 from cursedtypist.frontend import curses_frontend as cf
 
 
-@dataclass
 class CursesReplayController(game.GameController):
     """This controller replays the text automatically with very high speed."""
 
     text: str
-    pos: int = field(default=0)
-    cnt: int = field(default=0)
-
-    async def wait_key(self) -> str:
-        """Return the next key from the text."""
-        # imitate some delay in typing
-        await asyncio.sleep(0.015)
-
-        self.cnt += 1
-        if self.cnt % 10:
-            # get key and advance the pointer
-            key = self.text[self.pos]
-            self.pos += 1
-        else:
-            # imitate typos
-            key = chr(0)
-
-        return key
+    pos: int
+    cnt: int
+    typist: Optional[asyncio.Task[None]]
+
+    def __init__(self, model: game.GameModel, text: str):
+        """Create the controller replaying the text given."""
+        super().__init__(model)
+        self.text = text
+        self.pos = 0
+        self.cnt = 0
+        self.typist = None
+
+    def start_input(self) -> None:
+        """Start typing the text."""
+        self.typist = asyncio.create_task(self.type_text())
+
+    def stop_input(self) -> None:
+        """Stop typing the text."""
+        if self.typist is not None:
+            self.typist.cancel()
+
+    async def type_text(self) -> None:
+        """Feed the next keys from the text."""
+        while True:
+            # imitate some delay in typing
+            await asyncio.sleep(0.015)
+
+            self.cnt += 1
+            if self.cnt % 10:
+                # get key and advance the pointer
+                key = self.text[self.pos]
+                self.pos += 1
+            else:
+                # imitate typos
+                key = chr(0)
+
+            self.keys_pressed((key,))
 
 
 @dataclass
@@ -44,8 +63,11 @@ class CursesReplayFrontend(cf.CursesFrontend):
         """Run simplified game (without additional screens) in fast tempo."""
         view = cf.CursesView(screen)
         model = game.GameModel(view, text)
-        controller = CursesReplayController(model, text)
-        return asyncio.get_event_loop().run_until_complete(controller.loop())
+
+        async def replay() -> bool:
+            return await CursesReplayController(model, text).loop()
+
+        return asyncio.run(replay())
 
 
 def main() -> None:
@@ -0,0 +1,138 @@
+"""Testing the curses frontend."""
+
+# the drawing internals of the view are tested directly
+# pylint: disable=protected-access
+
+import asyncio
+import curses
+
+import pytest
+
+from cursedtypist import game
+from cursedtypist.frontend import curses_frontend
+
+
+@pytest.fixture
+def view(mocker) -> curses_frontend.CursesView:
+    """Return the curses view drawing on the mocked screen."""
+    mocked = mocker.patch.object(curses_frontend, "curses")
+    mocked.error = curses.error
+    screen = mocker.Mock()
+    screen.getmaxyx.return_value = (24, 80)
+    return curses_frontend.CursesView(screen)
+
+
+def test_view_slots(view):
+    """The view keeps its state in slots only."""
+    assert not hasattr(view, "__dict__")
+
+
+def test_flush_damage_overlapping(view, mocker):
+    """The latest change of the cell wins."""
+    view._damage_cells(5, 1, "abc")
+    view._damage_cells(5, 2, "X")
+    view._flush_damage()
+
+    assert view.screen.addstr.call_args_list == [mocker.call(5, 1, "aXc", 0)]
+
+
+def test_flush_damage_runs(view, mocker):
+    """The neighbour cells with the same attributes are drawn at once."""
+    view._damage_cells(5, 5, "=", 1)
+    view._damage_cells(5, 1, "  ")
+    view._damage_cells(5, 3, "==", 1)
+    view._damage_cells(4, 1, "x")
+    view._flush_damage()
+
+    assert view.screen.addstr.call_args_list == [
+        mocker.call(4, 1, "x", 0),
+        mocker.call(5, 1, "  ", 0),
+        mocker.call(5, 3, "===", 1),
+    ]
+
+    # the damage is drawn only once
+    view.screen.addstr.reset_mock()
+    view._flush_damage()
+    view.screen.addstr.assert_not_called()
+
+
+def test_read_keys(view, mocker):
+    """All the pending keys are read in one batch, the resize is handled."""
+    async def create():
+        return curses_frontend.CursesController(mocker.Mock(), view)
+
+    controller = asyncio.run(create())
+    controller.events = mocker.Mock()
+    view.screen.getkey.side_effect = ["a", "KEY_RESIZE", "b", curses.error]
+    view.screen.getmaxyx.return_value = (12, 40)
+
+    controller.read_keys()
+
+    controller.events.put_nowait.assert_called_once_with(
+        (game.Event.KEY, ("a", "b")))
+    assert view._get_limits() == (10, 38)
+
+
+def _floor_repaints(view):
+    """Count the full floor repaints made with `hline`."""
+    return sum(1 for call in view.screen.hline.call_args_list
+               if call.args[0] == curses_frontend.Params.FLOOR_LINE)
+
+
+def test_set_title_memo(view, mocker):
+    """The title is drawn once, and again after the screen is erased."""
+    params = curses_frontend.Params
+    view.init_screen()
+    view.screen.addstr.reset_mock()
+
+    # the same title is not drawn again
+    view._set_title(78, params.INIT_TITLE, params.INIT_PROMPT)
+    view.screen.addstr.assert_not_called()
+
+    # the title erased by the second init_screen is drawn again
+    view.init_screen()
+    assert view.screen.addstr.call_args_list == [
+        mocker.call(params.TITLE_LINE, 1, params.INIT_TITLE),
+        mocker.call(params.PROMPT_LINE, 1, params.INIT_PROMPT),
+    ]
+
+
+def test_print_message_memo(view):
+    """The repeated message is not drawn again."""
+    params = curses_frontend.Params
+    view.print_message("WRONG KEY")
+    view.print_message("WRONG KEY")
+    view.screen.addstr.assert_called_once_with(
+        params.MESSAGE_LINE, params.MESSAGE_COLUMN, "WRONG KEY",
+        view._attrs.lava)
+
+    # the message region is cleared once
+    view.print_message("")
+    view.print_message("")
+    view.screen.hline.assert_called_once_with(
+        params.MESSAGE_LINE, params.MESSAGE_COLUMN, " ",
+        78 - params.MESSAGE_COLUMN)
+
+    # the message erased by init_screen is drawn again
+    view.print_message("WRONG KEY")
+    view.init_screen()
+    view.screen.addstr.reset_mock()
+    view.print_message("WRONG KEY")
+    view.screen.addstr.assert_called_once_with(
+        params.MESSAGE_LINE, params.MESSAGE_COLUMN, "WRONG KEY",
+        view._attrs.lava)
+
+
+def test_drop_floor_invalidates_floor(view):
+    """The intact floor is repainted on page flips only after a drop."""
+    view.game_screen("x" * 1000)
+    assert _floor_repaints(view) == 1
+
+    # the floor is intact, so the page flip does not repaint it
+    view._update_game_screen(78)
+    assert _floor_repaints(view) == 1
+
+    # the broken floor is repainted by the next page flip
+    view.drop_floor()
+    view._update_game_screen(78)
+    assert _floor_repaints(view) == 2
@@ -1,5 +1,7 @@
 """Testing the typing game."""
 
+import asyncio
+
 import pytest
 
 from cursedtypist import game
@@ -126,6 +128,26 @@ def test_game_player_move_nok_lose(model):
     assert model.get_result() is False
 
 
+def test_game_player_input_batch(model):
+    """The model processes the batch of keys."""
+    model.start()
+    model.player_input(__TEST_TEXT[:2] + chr(0))
+
+    # player is moved and then the floor is dropped
+    assert model.player == 2
+    assert model.tracer == -params.PLAYER_INIT_OFFSET + 1
+    assert model.get_result() is None
+
+
+def test_game_player_input_batch_win(model):
+    """The model ignores the rest of the batch when the game is over."""
+    model.start()
+    model.player_input(__TEST_TEXT + chr(0))
+
+    model.view.drop_floor.assert_not_called()
+    assert model.get_result() is True
+
+
 def test_game_timer_fired(model):
     """The model drops the floor after the timer event."""
     model.start()
@@ -153,6 +175,30 @@ def test_game_timer_fired(model):
     assert model.get_result() is None
 
 
+def test_game_timer_fired_many(model):
+    """The model processes several coalesced timer ticks at once."""
+    model.start()
+
+    old_tracer = model.tracer
+    model.timer_fired(3)
+
+    assert model.tracer == old_tracer + 3
+    assert model.view.drop_floor.call_count == 3
+    model.view.death_screen.assert_not_called()
+    assert model.get_result() is None
+
+
+def test_game_timer_fired_many_lose(model):
+    """The floor does not crash further than the player."""
+    model.start()
+    model.timer_fired(params.PLAYER_INIT_OFFSET * 2)
+
+    assert model.tracer == model.player
+    assert model.view.drop_floor.call_count == params.PLAYER_INIT_OFFSET
+    model.view.death_screen.assert_called_once()
+    assert model.get_result() is False
+
+
 def test_game_timer_fired_lose(model):
     """The model set the lose state after many timer events."""
     model.start()
@@ -174,3 +220,142 @@ def test_game_timer_fired_lose(model):
     model.view.death_screen.assert_called()
     model.view.win_screen.assert_not_called()
     assert model.get_result() is False
+
+
+class _KeysController(game.GameController):
+    """Controller feeding the predefined keys at once."""
+
+    def __init__(self, model, keys):
+        super().__init__(model)
+        self.keys = keys
+        self.watching = False
+
+    def start_input(self):
+        self.watching = True
+        if self.keys:
+            self.keys_pressed(tuple(self.keys))
+
+    def stop_input(self):
+        self.watching = False
+
+
+def _play(mocker, keys):
+    """Run the game loop with the keys given and return the controller."""
+    async def play():
+        controller = _KeysController(
+            game.GameModel(mocker.Mock(), __TEST_TEXT), keys)
+        await controller.loop()
+        return controller
+
+    return asyncio.run(play())
+
+
+def test_game_controller_keys_win(mocker):
+    """The controller dispatches the keystrokes to the model."""
+    controller = _play(mocker, __TEST_TEXT)
+
+    assert controller.state.result() is True
+    assert controller.model.player == len(__TEST_TEXT)
+    assert not controller.watching
+
+
+def test_game_controller_timer_lose(mocker):
+    """The controller dispatches the timer ticks to the model."""
+    mocker.patch.object(game, "TIMER_PERIOD_SEC", 0.001)
+    controller = _play(mocker, "")
+
+    assert controller.state.result() is False
+    assert controller.model.tracer == controller.model.player
+    assert not controller.watching
+
+
+def test_game_controller_refresh_when_drained(mocker):
+    """The controller refreshes the view only when all events are processed."""
+    async def play():
+        controller = _KeysController(
+            game.GameModel(mocker.Mock(), __TEST_TEXT), "")
+        controller.model.view.refresh.reset_mock()
+
+        # queue several events at once before the game starts
+        controller.keys_pressed((__TEST_TEXT[0],))
+        controller.keys_pressed((chr(0),))
+        controller.keys_pressed(tuple(__TEST_TEXT[1:]))
+        await controller.loop()
+        return controller
+
+    controller = asyncio.run(play())
+    assert controller.state.result() is True
+
+    # one refresh after the start, one at the end of the game
+    assert controller.model.view.refresh.call_count == 2
+
+
+def test_game_controller_refresh_between_batches(mocker):
+    """The controller refreshes the view between the batches of keys."""
+    async def play():
+        controller = _KeysController(
+            game.GameModel(mocker.Mock(), __TEST_TEXT), __TEST_TEXT[0])
+        controller.model.view.refresh.reset_mock()
+
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.01, controller.keys_pressed, tuple(__TEST_TEXT[1:]))
+        await controller.loop()
+        return controller
+
+    controller = asyncio.run(play())
+    assert controller.state.result() is True
+
+    # the start, the frame after the first key and the end of the game
+    assert controller.model.view.refresh.call_count == 3
+
+
+def test_game_controller_timer_coalesced(mocker):
+    """The ticks missed by late timer are delivered as a single event."""
+    async def create():
+        return _KeysController(game.GameModel(mocker.Mock(), __TEST_TEXT), "")
+
+    controller = asyncio.run(create())
+    controller.events = mocker.Mock()
+    loop = mocker.Mock()
+    loop.time.return_value = 2.5 * params.TIMER_PERIOD_SEC
+
+    controller.timer_tick(loop)
+
+    controller.events.put_nowait.assert_called_once_with((game.Event.TIMER, 3))
+    assert controller.deadline == pytest.approx(3 * params.TIMER_PERIOD_SEC)
+    loop.call_at.assert_called_once_with(controller.deadline,
+                                         controller.timer_tick, loop)
+
+
+def test_game_controller_timer_early(mocker):
+    """The timer fired slightly before the deadline is still a tick."""
+    async def create():
+        return _KeysController(game.GameModel(mocker.Mock(), __TEST_TEXT), "")
+
+    controller = asyncio.run(create())
+    controller.events = mocker.Mock()
+    controller.deadline = params.TIMER_PERIOD_SEC
+    loop = mocker.Mock()
+    loop.time.return_value = 0.999 * params.TIMER_PERIOD_SEC
+
+    controller.timer_tick(loop)
+
+    controller.events.put_nowait.assert_called_once_with((game.Event.TIMER, 1))
+    assert controller.deadline == pytest.approx(2 * params.TIMER_PERIOD_SEC)
+
+
+def test_game_controller_timer_paused(mocker):
+    """The pause of the game process does not crash the whole floor."""
+    async def create():
+        return _KeysController(game.GameModel(mocker.Mock(), __TEST_TEXT), "")
+
+    controller = asyncio.run(create())
+    controller.events = mocker.Mock()
+    controller.deadline = params.TIMER_PERIOD_SEC
+    loop = mocker.Mock()
+    loop.time.return_value = 20 * params.TIMER_PERIOD_SEC
+
+    controller.timer_tick(loop)
+
+    controller.events.put_nowait.assert_called_once_with((game.Event.TIMER, 1))
+    assert controller.deadline == pytest.approx(21 * params.TIMER_PERIOD_SEC)
@@ -0,0 +1,86 @@
+"""Testing the game entry point helpers."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from cursedtypist import __main__ as main
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Keep the text cache inside the temporary directory."""
+    path = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(path))
+    return path
+
+
+def test_prepare_game_text_joins_lines(tmp_path):
+    """The text lines are joined into a single line with spaces."""
+    path = tmp_path / "text.txt"
+    path.write_text("  first line \n\nsecond\tline\n")
+    assert main.prepare_game_text(path) == "first line second line"
+
+
+def test_prepare_game_text_default():
+    """The default text is used when no path provided."""
+    assert "\n" not in main.prepare_game_text(None)
+
+
+def test_prepare_game_text_cached(tmp_path, cache_home):
+    """The prepared text is cached and reused on the next run."""
+    path = tmp_path / "text.txt"
+    path.write_text("some\ntext\n")
+    assert main.prepare_game_text(path) == "some text"
+
+    cached, = (cache_home / "cursedtypist").iterdir()
+    assert cached.read_text() == "some text"
+
+    # the cache is used while the file is not changed
+    cached.write_text("cached text")
+    assert main.prepare_game_text(path) == "cached text"
+
+
+def test_prepare_game_text_cache_invalidated(tmp_path):
+    """The changed file is prepared again."""
+    path = tmp_path / "text.txt"
+    path.write_text("some text")
+    assert main.prepare_game_text(path) == "some text"
+
+    path.write_text("another text")
+    assert main.prepare_game_text(path) == "another text"
+
+
+def test_get_game_text_pipe():
+    """The text can be read from a pipe like `--text <(cmd)`."""
+    rfd, wfd = os.pipe()
+    os.write(wfd, b"piped text")
+    os.close(wfd)
+    try:
+        assert main.get_game_text(Path(f"/dev/fd/{rfd}")) == "piped text"
+    finally:
+        os.close(rfd)
+
+
+def test_prepare_game_text_pipe_not_cached(cache_home):
+    """The text read from a pipe is not cached."""
+    rfd, wfd = os.pipe()
+    os.write(wfd, b"piped\ntext")
+    os.close(wfd)
+    try:
+        assert main.prepare_game_text(Path(f"/dev/fd/{rfd}")) == "piped text"
+    finally:
+        os.close(rfd)
+
+    assert not cache_home.exists()
+
+
+def test_get_game_text_not_utf8(tmp_path, capsys):
+    """The text which is not UTF-8 is reported without a traceback."""
+    path = tmp_path / "text.txt"
+    path.write_bytes(b"caf\xe9")
+    with pytest.raises(SystemExit):
+        main.get_game_text(path)
+
+    assert capsys.readouterr().out.startswith("cannot decode file:")